@@ -0,0 +1,86 @@
+"""Numeric core for the Bayer dither bakers.
+
+Computes, for every cell of a rows x cols grid, which color stop the
+ordered dither picks — returned as an int32 index grid into the caller's
+color list. Keeping this free of string work lets it JIT-compile: when
+numba is importable the kernel is compiled once (disk-cached via
+`cache=True`, parallel across rows), otherwise a vectorized NumPy
+fallback runs. Both paths produce identical grids.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional — the NumPy path is plenty for one-off bakes
+    HAVE_NUMBA = False
+
+
+def _chosen_numpy(rows, cols, num_colors, vertical, bayer):
+    if vertical:
+        t = (np.arange(rows) / max(rows - 1, 1))[:, None]
+    else:
+        t = (np.arange(cols) / max(cols - 1, 1))[None, :]
+    segment = t * (num_colors - 1)
+    color_index = np.clip(segment.astype(np.int32), 0, num_colors - 2)
+    gradient_level = (segment - color_index) * 15
+    thresh = np.tile(bayer, (rows // 4 + 1, cols // 4 + 1))[:rows, :cols]
+    return np.where(gradient_level >= thresh, color_index + 1, color_index).astype(np.int32)
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, parallel=True)
+    def _chosen_jit(rows, cols, num_colors, vertical, bayer):
+        chosen = np.empty((rows, cols), dtype=np.int32)
+        # The segment math only depends on the gradient-axis coordinate, so
+        # build per-axis tables once instead of redoing the divide/int-cast/
+        # clip for every cell. The float gradient level only ever meets
+        # integer thresholds, so `level >= bayer` is equivalent on
+        # floor(level) — quantizing lets the whole 4x4 matrix collapse to
+        # SWAR tables: 16 4-bit thresholds packed into one int, expanded to
+        # a 16-bit "advance to the next stop" mask per level. The hot loop
+        # is then a branchless shift/and/add per cell, no matrix loads.
+        packed = 0
+        for y in range(4):
+            for x in range(4):
+                packed |= int(bayer[y, x]) << ((y * 4 + x) * 4)
+        masks = np.zeros(16, dtype=np.int64)
+        for level in range(16):
+            m = 0
+            for i in range(16):
+                if (packed >> (i * 4)) & 0xF <= level:
+                    m |= 1 << i
+            masks[level] = m
+        n = rows if vertical else cols
+        denom = max(n - 1, 1)
+        color_index = np.empty(n, dtype=np.int32)
+        level_mask = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            segment = (i / denom) * (num_colors - 1)
+            ci = min(int(segment), num_colors - 2)
+            color_index[i] = ci
+            level_mask[i] = masks[int((segment - ci) * 15)]
+        if vertical:
+            for row in prange(rows):
+                ci = color_index[row]
+                m = level_mask[row]
+                base = (row & 3) << 2
+                for col in range(cols):
+                    chosen[row, col] = ci + ((m >> (base | (col & 3))) & 1)
+        else:
+            for row in prange(rows):
+                base = (row & 3) << 2
+                for col in range(cols):
+                    chosen[row, col] = color_index[col] + (
+                        (level_mask[col] >> (base | (col & 3))) & 1
+                    )
+        return chosen
+
+
+def chosen_indices(rows, cols, num_colors, vertical, bayer):
+    """Index of the color stop each cell dithers to, shape (rows, cols)."""
+    if HAVE_NUMBA:
+        return _chosen_jit(rows, cols, num_colors, vertical, bayer)
+    return _chosen_numpy(rows, cols, num_colors, vertical, bayer)
@@ -1,11 +1,11 @@
 #!/usr/bin/env node
 /**
  * Bake the brand-mark SVG (`docs/src/assets/icon.svg`) to a small PNG
- * for the header logo. The source SVG is pixel-art with 1,864 `<rect>`
- * elements (~167 KB transferred); the header displays it at 32×32. A
- * pre-rasterized 64×64 PNG (2× retina) drops the transfer to a few
- * KB and lets the browser cache + paint it like any other image
- * instead of parsing nearly 2,000 SVG nodes per page load.
+ * for the header logo. The source SVG is pixel-art baked as one `<path>`
+ * per palette color (~17 KB transferred); the header displays it at
+ * 32×32. A pre-rasterized 64×64 PNG (2× retina) still drops the
+ * transfer to a few KB and lets the browser cache + paint it like any
+ * other image instead of rasterizing the paths per page load.
  *
  * Scoped to the HEADER ONLY — `BrandIcon.astro`, `BrandAsset.astro`,
  * and favicon references continue to read from the source SVG.
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Generate the Bayer-dithered gradient tiles for the docs (manual re-bake tool).
+
+The retro theme fakes smooth gradients with ordered dithering — big cells,
+hard edges, no banding at any zoom. This bakes the gradient tiles: the large
+backdrop SVGs land in `out/` (copy them wherever they're consumed), and the
+small 32x128 versions are printed as `--grad-*` CSS custom properties with
+the SVG inlined as a data URI, ready to paste into the theme styles.
+
+    python3 docs/scripts/generate-bayer-gradients.py
+
+Requires numpy (`pip install numpy`). The per-cell dither math runs over the
+whole tile as array ops — the 128x1024 hero tile is 16x128 cells, and the
+pure-Python version of this loop was the slowest part of a re-bake.
+
+Sibling: generate-patterns.py bakes the flat 4x4 dither/texture swatches.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from _bayer_mask import chosen_indices
+
+OUTPUT_DIR = Path(__file__).parent / 'out'
+
+BAYER_4x4 = [
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+]
+
+BAYER = np.array(BAYER_4x4, dtype=np.uint8)
+
+# Theme colors as plain module constants — nothing here needs the name at
+# runtime (unlike generate-patterns.py, whose palette names become CSS
+# variable names), and constants keep the lru_cache keys interned strings.
+MIDNIGHT = '#050618'
+DARK_PURPLE = '#1a1032'
+DEEP_PURPLE = '#2b1a4e'
+VIOLET = '#4c2a85'
+MAGENTA = '#b3199e'
+CYAN = '#47cca9'
+GOLD = '#f1c45f'
+CREAM = '#f0edd8'
+
+
+# The baked SVG markup only ever contains five characters that need escaping
+# in a data URI, so a single str.translate pass replaces urllib.parse.quote
+# (which walks its full safe-set machinery per call). Same table as the
+# sibling generate-patterns.py.
+_URI_TRANS = str.maketrans({'"': "'", '#': '%23', '<': '%3C', '>': '%3E', ' ': '%20'})
+
+
+def svg_to_data_uri(svg):
+    return f'url("data:image/svg+xml,{svg.decode("ascii").translate(_URI_TRANS)}")'
+
+
+def _paths_from_grid(cell_colors, pixel_size):
+    rows, cols = cell_colors.shape
+    # Adjacent same-color cells in a row coalesce into one run (dithered rows
+    # are mostly long runs), and all of a color's runs collapse into a single
+    # <path> — `M x y h w v h h -w z` per run costs ~20 bytes against ~55 for
+    # a <rect>, and none of `Mhvz` inflate under URL-encoding the way
+    # `<`, `>` and `"` do. The emit stage stays in bytes — the color LUT
+    # holds pre-encoded bytes and the document is assembled with one C-level
+    # b''.join — so no per-run str formatting machinery runs beyond the
+    # % fill-in.
+    tmpl = b'M%d %dh%dv' + str(pixel_size).encode() + b'h-%dz'
+    by_color = {}
+    for row in range(rows):
+        y = row * pixel_size
+        row_colors = cell_colors[row]
+        breaks = np.flatnonzero(row_colors[1:] != row_colors[:-1]) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [cols]))
+        for start, end in zip(starts, ends):
+            w = (end - start) * pixel_size
+            by_color.setdefault(row_colors[start], []).append(tmpl % (start * pixel_size, y, w, w))
+    return [
+        b'<path fill="%s" d="%s"/>' % (color, b''.join(runs))
+        for color, runs in by_color.items()
+    ]
+
+
+def _svg_document(paths, width, height):
+    header = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" shape-rendering="crispEdges">'
+    )
+    return header.encode() + b''.join(paths) + b'</svg>'
+
+
+@lru_cache(maxsize=None)
+def _render_gradient(colors, width, height, direction, pixel_size):
+    """Shared memoized kernel — `colors` is a tuple so repeated renders of the
+    same stop list (hero_colors shows up in both main() sections) hit cache."""
+    rows = height // pixel_size
+    cols = width // pixel_size
+    chosen = chosen_indices(rows, cols, len(colors), direction == 'vertical', BAYER)
+    lut = np.array([c.encode() for c in colors], dtype=object)
+    return _svg_document(_paths_from_grid(lut[chosen], pixel_size), width, height)
+
+
+def generate_bayer_gradient_svg(color_a, color_b, width, height, direction='vertical', pixel_size=8):
+    """Two-color ordered-dither fade — the two-stop case of the shared kernel."""
+    return _render_gradient((color_a, color_b), width, height, direction, pixel_size)
+
+
+def generate_multi_color_gradient_svg(colors, width, height, direction='vertical', pixel_size=8):
+    """N-stop ordered-dither gradient: the gradient axis is split into
+    N-1 segments and each cell dithers between its segment's two stops."""
+    return _render_gradient(tuple(colors), width, height, direction, pixel_size)
+
+
+@lru_cache(maxsize=None)
+def generate_and_encode(colors, width, height, direction='vertical', pixel_size=8):
+    """Render once, encode once; returns (svg bytes, data URI) so a caller
+    needing both — or hitting the same tile twice — never re-traverses."""
+    svg = _render_gradient(colors, width, height, direction, pixel_size)
+    return svg, svg_to_data_uri(svg)
+
+
+def main():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    hero_colors = [MIDNIGHT, DARK_PURPLE, DEEP_PURPLE, VIOLET]
+
+    tiles = {
+        'hero-backdrop': (hero_colors, 128, 1024),
+        'header-fade': ([DEEP_PURPLE, DARK_PURPLE, MIDNIGHT], 128, 512),
+        'footer-rise': ([MIDNIGHT, DARK_PURPLE, DEEP_PURPLE], 128, 512),
+        'gem-wash': ([MIDNIGHT, VIOLET, MAGENTA], 128, 512),
+        'aurora': ([MIDNIGHT, DEEP_PURPLE, CYAN], 128, 512),
+    }
+
+    for name, (colors, width, height) in tiles.items():
+        svg = generate_multi_color_gradient_svg(colors, width, height)
+        out = OUTPUT_DIR / f'{name}.svg'
+        out.write_bytes(svg)
+        print(f'wrote {out} ({out.stat().st_size / 1024:.1f} KB)')
+
+    print()
+    print('/* inline tiles — paste into the theme styles */')
+    print(':root {')
+    for name, (colors, _, _) in tiles.items():
+        _, uri = generate_and_encode(tuple(colors), 32, 128)
+        print(f'  --grad-{name}: {uri};')
+    print('}')
+
+
+if __name__ == '__main__':
+    main()
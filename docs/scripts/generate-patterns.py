@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Generate the 4x4 dither/texture swatches as CSS custom properties.
+
+The retro theme layers tiny repeating SVG tiles over flat fills —
+`--dither-dark-50` under the cards, scanlines/checker/dots accents in
+the decks. Each swatch is a 16x16 tile (4x4 cells at 4px) inlined as a
+URL-encoded data URI. This prints the whole `--dither-*` /
+`--scanlines-*` / `--checker-*` / `--dots-*` / `--crosshatch-*` block to
+stdout — paste it into the theme styles where the block lives.
+
+    python3 docs/scripts/generate-patterns.py
+
+Dither opacity steps are Bayer thresholds out of 16, named by percentage
+(threshold 2 -> `-12`, threshold 8 -> `-50`). The wide `--dither-fade-*`
+strip is a 960px horizontal solid-to-transparent dissolve.
+
+Sibling: generate-bayer-gradients.py bakes the large gradient tiles.
+"""
+
+from functools import lru_cache
+
+SCALE = 4  # px per pattern cell -> 16x16 tiles
+
+BAYER_4x4 = [
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+]
+
+PALETTE = {
+    'cyan': '#47cca9',
+    'emerald': '#4cd1b1',
+    'diamond': '#6cb8ff',
+    'amethyst': '#b88af7',
+    'magenta': '#b3199e',
+    'salmon': '#ff8a6b',
+    'gold': '#f1c45f',
+    'cream': '#f0edd8',
+    'dark': '#1a1032',
+    'midnight': '#050618',
+}
+
+DITHER_THRESHOLDS = [1, 2, 4, 6, 8, 10, 12]
+
+# "On" cells per threshold, indexable by the threshold itself (0..16), with
+# the px coordinates pre-multiplied by SCALE. The Bayer matrix is tiny and
+# fixed, so every dither swatch reduces to formatting one prebuilt cell list.
+_ON_CELLS = [
+    tuple(
+        (x * SCALE, y * SCALE)
+        for y, row in enumerate(BAYER_4x4)
+        for x, v in enumerate(row)
+        if v < t
+    )
+    for t in range(17)
+]
+
+
+# Single-pass URL encoding for the handful of characters the SVG markup
+# actually contains — one translate instead of five chained .replace()
+# passes, each of which re-allocated the whole string.
+_URI_TRANS = str.maketrans({'"': "'", '#': '%23', '<': '%3C', '>': '%3E', ' ': '%20'})
+
+
+@lru_cache(maxsize=None)
+def svg_to_uri(svg):
+    return f'url("data:image/svg+xml,{svg.translate(_URI_TRANS)}")'
+
+
+@lru_cache(maxsize=None)
+def generate_bayer_svg_4x(color, threshold):
+    size = 4 * SCALE
+    if threshold <= 0:
+        return f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}"></svg>'
+    if threshold >= 16:
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+            f'<rect x="0" y="0" width="{size}" height="{size}" fill="{color}"/></svg>'
+        )
+    pixels = [
+        f'<rect x="{x}" y="{y}" width="{SCALE}" height="{SCALE}" fill="{color}"/>'
+        for x, y in _ON_CELLS[threshold]
+    ]
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+        + ''.join(pixels)
+        + '</svg>'
+    )
+
+
+@lru_cache(maxsize=None)
+def generate_scanlines_svg_4x(color):
+    size = 4 * SCALE
+    pixels = []
+    for y in range(0, 4, 2):
+        pixels.append(f'<rect x="0" y="{y * SCALE}" width="{size}" height="{SCALE}" fill="{color}"/>')
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+        + ''.join(pixels)
+        + '</svg>'
+    )
+
+
+@lru_cache(maxsize=None)
+def generate_checker_svg_4x(color):
+    size = 4 * SCALE
+    pixels = []
+    for y in range(4):
+        for x in range(4):
+            if (x + y) % 2 == 0:
+                pixels.append(
+                    f'<rect x="{x * SCALE}" y="{y * SCALE}" width="{SCALE}" height="{SCALE}" fill="{color}"/>'
+                )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+        + ''.join(pixels)
+        + '</svg>'
+    )
+
+
+@lru_cache(maxsize=None)
+def generate_dots_svg_4x(color):
+    size = 4 * SCALE
+    pixels = [f'<rect x="{SCALE}" y="{SCALE}" width="{SCALE}" height="{SCALE}" fill="{color}"/>']
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+        + ''.join(pixels)
+        + '</svg>'
+    )
+
+
+@lru_cache(maxsize=None)
+def generate_crosshatch_svg_4x(color):
+    size = 4 * SCALE
+    pixels = []
+    for y in range(4):
+        for x in range(4):
+            if x == y or x + y == 3:
+                pixels.append(
+                    f'<rect x="{x * SCALE}" y="{y * SCALE}" width="{SCALE}" height="{SCALE}" fill="{color}"/>'
+                )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+        + ''.join(pixels)
+        + '</svg>'
+    )
+
+
+@lru_cache(maxsize=None)
+def generate_bayer_horizontal_gradient_svg(color, width_cells=60, solid_cells=40):
+    fade_cells = width_cells - solid_cells
+    width = width_cells * 4 * SCALE
+    height = 4 * SCALE
+    # The strip repeats the same 17 dither cells hundreds of times, so define
+    # each threshold's cell once in <defs> and stamp it with <use> — the 40
+    # solid cells alone would otherwise be 640 identical rects, and this file
+    # ships URL-encoded inside the CSS on every page.
+    # Columns at or above threshold 16 need no dither at all — one wide rect
+    # covers the whole solid region (the first fade column rounds to 16 too).
+    # Dithering columns (0 < threshold < 16) stamp their threshold's cell
+    # from <defs>; fully-off columns emit nothing.
+    thresholds = []
+    for cell_x in range(width_cells):
+        if cell_x < solid_cells:
+            thresholds.append(16)
+        else:
+            thresholds.append(int(16 * (1 - (cell_x - solid_cells) / fade_cells)))
+    solid_count = sum(1 for t in thresholds if t >= 16)
+    solid = f'<rect x="0" y="0" width="{solid_count * 4 * SCALE}" height="{height}" fill="{color}"/>'
+    defs = []
+    for t in sorted(set(thresholds)):
+        if not _ON_CELLS[t] or t >= 16:
+            continue
+        cells = ''.join(
+            f'<rect x="{x}" y="{y}" width="{SCALE}" height="{SCALE}" fill="{color}"/>'
+            for x, y in _ON_CELLS[t]
+        )
+        defs.append(f'<g id="c{t}">{cells}</g>')
+    uses = [
+        f'<use href="#c{t}" x="{cell_x * 4 * SCALE}"/>'
+        for cell_x, t in enumerate(thresholds)
+        if _ON_CELLS[t] and t < 16
+    ]
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">'
+        + '<defs>' + ''.join(defs) + '</defs>'
+        + solid
+        + ''.join(uses)
+        + '</svg>'
+    )
+
+
+def main():
+    print('/* generated by docs/scripts/generate-patterns.py — paste into the theme styles */')
+    print(':root {')
+    for name, color in PALETTE.items():
+        for threshold in DITHER_THRESHOLDS:
+            pct = threshold * 100 // 16
+            print(f'  --dither-{name}-{pct}: {svg_to_uri(generate_bayer_svg_4x(color, threshold))};')
+    for name, color in PALETTE.items():
+        print(f'  --scanlines-{name}: {svg_to_uri(generate_scanlines_svg_4x(color))};')
+        print(f'  --checker-{name}: {svg_to_uri(generate_checker_svg_4x(color))};')
+        print(f'  --dots-{name}: {svg_to_uri(generate_dots_svg_4x(color))};')
+        print(f'  --crosshatch-{name}: {svg_to_uri(generate_crosshatch_svg_4x(color))};')
+    for name in ('cyan', 'gold'):
+        print(f'  --dither-fade-{name}: {svg_to_uri(generate_bayer_horizontal_gradient_svg(PALETTE[name]))};')
+    print('}')
+
+
+if __name__ == '__main__':
+    main()
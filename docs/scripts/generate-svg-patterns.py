@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Generate the full-page backdrop SVGs: dithered gradient and starfield.
+
+Two tiny tiles that stretch/repeat behind the docs content: an 8x512
+vertical gradient through the theme purples (midnight -> deep purple ->
+midnight, Bayer 8x8 ordered dither so it stays banding-free when CSS
+stretches it), and a 64x64 starfield with deterministically placed
+single-pixel stars. Both land in `out/` — copy them wherever they're
+consumed.
+
+    python3 docs/scripts/generate-svg-patterns.py
+
+Requires numpy (`pip install numpy`): the gradient's per-pixel dither
+compare runs over the whole 8x512 tile as one broadcast expression
+instead of ~4k interpreter iterations.
+
+The starfield draws from a PRNG seeded off the seed string, so the sky
+never reshuffles between re-bakes.
+
+Siblings: generate-bayer-gradients.py (large gradient tiles) and
+generate-patterns.py (4x4 dither swatches).
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+OUTPUT_DIR = Path(__file__).parent / 'out'
+
+BAYER_8x8 = [
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21],
+]
+
+# Thresholds pre-divided to floats once at import; the dither compare only
+# ever needs v/64.
+BAYER_F = np.array(BAYER_8x8) / 64.0
+
+GRADIENT_COLORS = ['#050618', '#1a1032', '#2b1a4e', '#1a1032', '#050618']
+
+STAR_COLORS = ['#f0edd8', '#47cca9', '#f1c45f']
+
+
+def generate_dithered_gradient(colors, width=8, height=512):
+    num_colors = len(colors)
+    band_height = height / (num_colors - 1)
+    # All the per-pixel math as one broadcast: each row's position inside its
+    # color band against the tiled 8x8 Bayer thresholds.
+    ys = np.arange(height)
+    band_idx = np.minimum((ys / band_height).astype(int), num_colors - 2)
+    progress = ys / band_height - band_idx
+    thresholds = BAYER_F[ys[:, None] & 7, np.arange(width)[None, :] & 7]
+    colors_arr = np.array([c.encode() for c in colors], dtype=object)
+    chosen = np.where(
+        progress[:, None] > thresholds,
+        colors_arr[band_idx + 1][:, None],
+        colors_arr[band_idx][:, None],
+    )
+    # A Bayer dither over a vertical gradient leaves long horizontal runs of
+    # one color per row — coalesce each run into a single wide rect (same
+    # trick as generate-bayer-gradients.py) instead of 1x1 rects per pixel.
+    # The markup is pure ASCII, so it is assembled as bytes end to end and
+    # written with write_bytes — no codec pass over the finished document.
+    tmpl = b'<rect x="%d" y="%d" width="%d" height="1" fill="%s"/>'
+    pixels = []
+    append = pixels.append
+    for y in range(height):
+        row = chosen[y]
+        breaks = np.flatnonzero(row[1:] != row[:-1]) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [width]))
+        for start, end in zip(starts, ends):
+            append(tmpl % (start, y, end - start, row[start]))
+    header = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" preserveAspectRatio="none" shape-rendering="crispEdges">\n'
+    )
+    return header.encode() + b'\n'.join(pixels) + b'\n</svg>'
+
+
+def generate_stars(width=64, height=64, density=0.025, seed='flatland'):
+    # One PRNG seeded from the seed string replaces an MD5 digest per pixel
+    # (4096 hash invocations to draw 4096 uniforms). Still fully
+    # deterministic: the same seed always bakes the same sky.
+    rng = np.random.default_rng(int.from_bytes(hashlib.md5(seed.encode()).digest(), 'big'))
+    r = rng.random((height, width))
+    pick = rng.integers(0, len(STAR_COLORS), (height, width))
+    ys, xs = np.where(r < density)
+    star_colors = [c.encode() for c in STAR_COLORS]
+    pixels = [
+        b'<rect x="%d" y="%d" width="1" height="1" fill="%s"/>' % (x, y, star_colors[pick[y, x]])
+        for y, x in zip(ys, xs)
+    ]
+    header = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" shape-rendering="crispEdges">\n'
+    )
+    return header.encode() + b'\n'.join(pixels) + b'\n</svg>'
+
+
+# Everything a tile depends on that isn't passed as an argument — the Bayer
+# matrix, palettes, default parameters and the emit logic itself — lives in
+# this file, so hashing the script source covers it all: any edit to the
+# baker invalidates every stamp without a version constant to forget to bump.
+_CODE_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _bake(path, render, *args, **kwargs):
+    """Re-render only when the inputs changed: the hash of the render call
+    (function, arguments, and this script's source) is stamped in an XML
+    comment on the first line, so an up-to-date file costs one read instead
+    of a render."""
+    key_parts = (render.__name__, args, sorted(kwargs.items()), _CODE_HASH)
+    key = hashlib.sha256(repr(key_parts).encode()).hexdigest()[:16]
+    stamp = f'<!-- bake:{key} -->\n'.encode()
+    if path.exists() and path.read_bytes().startswith(stamp):
+        print(f'{path.name} up to date')
+        return
+    svg = stamp + render(*args, **kwargs)
+    path.write_bytes(svg)
+    print(f'wrote {path.name} ({len(svg) / 1024:.1f} KB)')
+
+
+def main():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    _bake(OUTPUT_DIR / 'bg-gradient.svg', generate_dithered_gradient, GRADIENT_COLORS)
+    _bake(OUTPUT_DIR / 'bg-stars.svg', generate_stars)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Generate the three-flatland brand icon: an isometric pixel-art slab
+with a dithered "FL" face.
+
+One 48x48 pixel grid, drawn twice: a mono palette for the repo asset
+(`assets/icon.svg`) and the parchment palette for the docs
+(`docs/src/assets/icon.svg`, reused as `docs/public/favicon.svg`).
+Brightness falls off across each face with distance from the lit corner
+and is quantized through the 4x4 Bayer matrix — the same ordered dither
+the docs theme uses everywhere else.
+
+    python3 scripts/make-icon.py
+
+Writes the three SVGs in place. After editing the docs icon, re-bake
+the header PNG with `node docs/scripts/bake-brand-icon.mjs`.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+BAYER_4x4 = [
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+]
+
+# Thresholds pre-divided once — the face loops only ever need v/16.
+BAYER_F = np.array(BAYER_4x4) / 16.0
+
+MONO = {
+    'front_light': '#FFFFFF',
+    'front_dark': '#E0E0E0',
+    'top_light': '#E0E0E0',
+    'top_dark': '#999999',
+    'side_light': '#777777',
+    'side_dark': '#444444',
+    'ink': '#000000',
+}
+
+PARCHMENT = {
+    'front_light': '#f0edd8',
+    'front_dark': '#d3d0be',
+    'top_light': '#d3d0be',
+    'top_dark': '#908e82',
+    'side_light': '#706f65',
+    'side_dark': '#403f3a',
+    'ink': '#00021c',
+}
+
+
+class PixelCanvas:
+    """Dense palette-indexed pixel grid. Colors are interned to small int
+    indices so the canvas itself is an int8 array — writes are plain array
+    stores, fill_rect is one slice assignment, and -1 marks untouched."""
+
+    def __init__(self, width, height, pixel_size):
+        self.width = width
+        self.height = height
+        self.pixel_size = pixel_size
+        self.grid = np.full((height, width), -1, dtype=np.int8)
+        self._palette = []
+        self._palette_idx = {}
+
+    def _intern(self, color):
+        idx = self._palette_idx.get(color)
+        if idx is None:
+            idx = self._palette_idx[color] = len(self._palette)
+            self._palette.append(color)
+        return idx
+
+    def set_pixel(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.grid[y, x] = self._intern(color)
+
+    def fill_rect(self, x, y, w, h, color):
+        self.grid[max(y, 0):y + h, max(x, 0):x + w] = self._intern(color)
+
+    def paint(self, px, py, light, c_light, c_dark):
+        """Vector set_pixel: write whole coordinate arrays at once, choosing
+        between two colors with a boolean dither mask."""
+        idx = np.where(light, self._intern(c_light), self._intern(c_dark))
+        inb = (0 <= px) & (px < self.width) & (0 <= py) & (py < self.height)
+        self.grid[py[inb], px[inb]] = idx[inb]
+
+    def to_svg(self):
+        ps = self.pixel_size
+        w = self.width * ps
+        h = self.height * ps
+        # One <path> per palette color: contiguous horizontal pixels coalesce
+        # into M/h/v/z subpath runs. Renderers paint a handful of paths far
+        # faster than ~1900 rect nodes, and the file shrinks to match. The
+        # run template is preparsed once with the constant cell height baked
+        # in, as the other bakers do, instead of a fresh f-string per run.
+        tmpl = f'M%d %dh%dv{ps}h-%dz'
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {w} {h}" width="{w}" height="{h}">'
+        ]
+        for idx, color in enumerate(self._palette):
+            runs = []
+            for y in range(self.height):
+                xs = np.flatnonzero(self.grid[y] == idx)
+                if not xs.size:
+                    continue
+                starts = np.flatnonzero(np.diff(xs) > 1) + 1
+                for seg in np.split(xs, starts):
+                    run = len(seg) * ps
+                    runs.append(tmpl % (seg[0] * ps, y * ps, run, run))
+            parts.append(
+                f'<path fill="{color}" shape-rendering="crispEdges" d="{"".join(runs)}" />'
+            )
+        parts.append('</svg>')
+        return '\n'.join(parts)
+
+
+@lru_cache(maxsize=None)
+def _brightness_table(max_dist):
+    """Falloff curve (1 - d/max)^1.5 * 1.1 for every integer distance — the
+    pow only ever sees max_dist+1 distinct inputs per face, not one per
+    pixel, and the side/top faces share one table."""
+    return (1.0 - np.arange(max_dist + 1) / max_dist) ** 1.5 * 1.1
+
+
+def _dither_face(canvas, px, py, dist, max_dist, c_light, c_dark):
+    """Shared face shader: brightness falls off with normalized distance from
+    the lit corner and quantizes through the Bayer threshold at each pixel's
+    canvas position. All arguments past the canvas are coordinate/distance
+    arrays from one meshgrid per face."""
+    br = _brightness_table(max_dist)[dist]
+    canvas.paint(px, py, br > BAYER_F[py & 3, px & 3], c_light, c_dark)
+
+
+# "FL" glyph on a coarse 4x4-cell grid over the front face.
+FL_PIXELS = [
+    # F
+    (1, 2), (2, 2), (3, 2),
+    (1, 3),
+    (1, 4), (2, 4),
+    (1, 5),
+    (1, 6),
+    # L
+    (5, 2), (5, 3), (5, 4), (5, 5),
+    (5, 6), (6, 6), (7, 6),
+]
+
+
+def generate_icon(palette):
+    s = 36           # front face size in pixels
+    d = 8            # extrusion depth
+    fx, fy = 2, 10   # front face origin
+    max_dist = s + d * 3
+    canvas = PixelCanvas(48, 48, 8)
+
+    # top-right edge between the two back faces
+    for j in range(d):
+        canvas.set_pixel(fx + s + j, fy - 1 - j, palette['top_dark'])
+
+    # Each face is one meshgrid of its (i, j) surface coordinates pushed
+    # through the shared shader — all array math instead of ~2000
+    # interpreted set_pixel calls.
+
+    # side face
+    i, j = np.meshgrid(np.arange(1, s), np.arange(d), indexing='ij')
+    _dither_face(canvas, fx + s + j, fy - 1 - j + i, i + j * 3, max_dist,
+                 palette['side_light'], palette['side_dark'])
+
+    # top face
+    i, j = np.meshgrid(np.arange(s), np.arange(d), indexing='ij')
+    _dither_face(canvas, fx + i + j + 1, fy - 1 - j, i + j * 3, max_dist,
+                 palette['top_light'], palette['top_dark'])
+
+    # front face
+    i, j = np.meshgrid(np.arange(s), np.arange(s), indexing='ij')
+    _dither_face(canvas, fx + i, fy + j, i + j, s * 2,
+                 palette['front_light'], palette['front_dark'])
+
+    # FL glyph
+    scale = 4
+    for gx, gy in FL_PIXELS:
+        canvas.fill_rect(fx + gx * scale, fy + gy * scale, scale, scale, palette['ink'])
+
+    return canvas.to_svg()
+
+
+def main():
+    mono = generate_icon(MONO)
+    parchment = generate_icon(PARCHMENT)
+
+    for path, svg in [
+        (ROOT / 'assets' / 'icon.svg', mono),
+        (ROOT / 'docs' / 'src' / 'assets' / 'icon.svg', parchment),
+        (ROOT / 'docs' / 'public' / 'favicon.svg', parchment),
+    ]:
+        path.write_text(svg)
+        print(f'wrote {path.relative_to(ROOT)} ({len(svg) / 1024:.1f} KB)')
+
+
+if __name__ == '__main__':
+    main()